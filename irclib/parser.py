@@ -4,8 +4,9 @@ Backported from async-irc (https://github.com/snoonetIRC/async-irc.git)
 """
 
 import re
-from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from typing import (
+    Callable,
     Dict,
     Final,
     Iterable,
@@ -21,7 +22,7 @@ from typing import (
 
 from typing_extensions import Self, TypeAlias
 
-from irclib.errors import ParseError
+from irclib.util.numerics import numerics
 
 __all__ = (
     "Cap",
@@ -50,10 +51,6 @@ TRAIL_SENTINEL: Final = ":"
 CAP_SEP: Final = " "
 CAP_VALUE_SEP: Final = "="
 
-PREFIX_RE: Final = re.compile(
-    r"^:?(?P<nick>.*?)(?:!(?P<user>.*?))?(?:@(?P<host>.*?))?$"
-)
-
 TAG_VALUE_ESCAPES: Final = {
     "\\s": " ",
     "\\:": ";",
@@ -62,30 +59,104 @@ TAG_VALUE_ESCAPES: Final = {
     "\\\\": "\\",
 }
 
-TAG_VALUE_UNESCAPES: Final = {
-    unescaped: escaped for escaped, unescaped in TAG_VALUE_ESCAPES.items()
+# A trailing lone backslash is matched with an empty group so it is dropped
+TAG_VALUE_ESCAPE_RE: Final = re.compile(r"\\(.?)", re.DOTALL)
+
+TAG_VALUE_ESCAPE_TABLE: Final = str.maketrans(
+    {" ": "\\s", ";": "\\:", "\r": "\\r", "\n": "\\n", "\\": "\\\\"}
+)
+
+# Canonical string objects for the commands seen on nearly every line, so
+# parsed messages share them instead of each holding a fresh copy
+KNOWN_COMMANDS: Final[Dict[str, str]] = {
+    command: command
+    for command in (
+        "ACCOUNT",
+        "AUTHENTICATE",
+        "AWAY",
+        "BATCH",
+        "CAP",
+        "CHGHOST",
+        "ERROR",
+        "INVITE",
+        "JOIN",
+        "KICK",
+        "KILL",
+        "MODE",
+        "NICK",
+        "NOTICE",
+        "PART",
+        "PING",
+        "PONG",
+        "PRIVMSG",
+        "QUIT",
+        "SETNAME",
+        "TAGMSG",
+        "TOPIC",
+        "WALLOPS",
+        *numerics,
+    )
 }
 
+# Upper bound on the raw command -> canonical command cache below, since the
+# command text comes from the server and is otherwise unbounded
+COMMAND_CACHE_SIZE: Final = 1024
+
+_command_cache: Dict[str, str] = dict(KNOWN_COMMANDS)
+
 SelfT = TypeVar("SelfT")
 
 
-class Parseable(metaclass=ABCMeta):
-    """Abstract class for parseable objects."""
+class Parseable:
+    """Base class for parseable objects.
+
+    This is a plain class rather than an ABC, so subclass creation and
+    isinstance checks don't go through the ABCMeta machinery.
+    """
+
+    __slots__ = ()
 
     @classmethod
-    @abstractmethod
     def parse(cls, text: str) -> Self:
         """Parse the object from a string."""
         raise NotImplementedError
 
-    @abstractmethod
     def __str__(self) -> str:
         raise NotImplementedError
 
+    def _cmp_key(self, obj: object) -> object:
+        """Get the value `obj` is compared by, or NotImplemented.
+
+        Subclasses handle objects of their own type and defer to this for
+        anything else. Strings are parsed as the same type as this object.
+        """
+        if isinstance(obj, str):
+            return self._cmp_key(self.parse(obj))
+
+        return NotImplemented
+
+    def __eq__(self, other: object) -> bool:
+        """Compare to another object of this type or a string to parse."""
+        other_key = self._cmp_key(other)
+        if other_key is NotImplemented:
+            return NotImplemented
+
+        return self._cmp_key(self) == other_key
+
+    def __ne__(self, other: object) -> bool:
+        """Compare to another object of this type or a string to parse."""
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return NotImplemented
+
+        return not result
+
 
 class Cap(Parseable):
     """Represents a CAP entity as defined in IRCv3.2."""
 
+    __slots__ = ("_name", "_value")
+
     def __init__(self, name: str, value: Optional[str] = None) -> None:
         """Construct Cap object.
 
@@ -116,73 +187,49 @@ class Cap(Parseable):
         name, _, value = text.partition(CAP_VALUE_SEP)
         return cls(name, value or None)
 
-    def __eq__(self, other: object) -> bool:
-        """Compare against another cap."""
-        if isinstance(other, str):
-            return self == self.parse(other)
-
-        if isinstance(other, Cap):
-            return self.as_tuple() == other.as_tuple()
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, Cap):
+            return obj.as_tuple()
 
-        return NotImplemented
-
-    def __ne__(self, other: object) -> bool:
-        """Compare against another cap."""
-        if isinstance(other, str):
-            return self != self.parse(other)
-
-        if isinstance(other, Cap):
-            return self.as_tuple() != other.as_tuple()
-
-        return NotImplemented
+        return super()._cmp_key(obj)
 
     def __str__(self) -> str:
         """Represent cap as a string."""
-        if self.value:
-            return CAP_VALUE_SEP.join((self.name, self.value))
+        if self._value:
+            return f"{self._name}{CAP_VALUE_SEP}{self._value}"
 
-        return self.name
+        return self._name
 
 
 class CapList(Parseable, List[Cap]):
     """Represents a list of CAP entities."""
 
+    __slots__ = ()
+
     @classmethod
     def parse(cls, text: str) -> Self:
         """Parse a list of CAPs from a string."""
-        if text.startswith(":"):
+        if text[:1] == ":":
             text = text[1:]  # Remove leading colon
 
         # We want to strip any leading or trailing whitespace
         # Some networks (ie: freenode) send a trailing space in a CAP ACK
-        stripped = text.strip()
-
-        caps: Iterable[Cap]
-        caps = (
-            [] if not text else (Cap.parse(s) for s in stripped.split(CAP_SEP))
-        )
-
-        return cls(caps)
-
-    def __eq__(self, other: object) -> bool:
-        """Compare to a string cap list or list of Cap objects."""
-        if isinstance(other, str):
-            return self == self.parse(other)
-
-        if isinstance(other, list):
-            return list(self) == list(other)
+        caps = cls()
+        if not text:
+            return caps
 
-        return NotImplemented
+        for item in text.strip().split(CAP_SEP):
+            # Inlined Cap.parse
+            name, _, value = item.partition(CAP_VALUE_SEP)
+            caps.append(Cap(name, value or None))
 
-    def __ne__(self, other: object) -> bool:
-        """Compare to a string cap list or sequence of Cap objects."""
-        if isinstance(other, str):
-            return self != self.parse(other)
+        return caps
 
-        if isinstance(other, list):
-            return list(self) != list(other)
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, list):
+            return list(obj)
 
-        return NotImplemented
+        return super()._cmp_key(obj)
 
     def __str__(self) -> str:
         """Represent the list of caps as a string."""
@@ -192,6 +239,8 @@ class CapList(Parseable, List[Cap]):
 class MessageTag(Parseable):
     """Basic class to wrap a message tag."""
 
+    __slots__ = ("_has_value", "_name", "_value")
+
     def __init__(
         self, name: str, value: str = "", *, has_value: bool = False
     ) -> None:
@@ -223,18 +272,10 @@ class MessageTag(Parseable):
         :param value: Escaped string
         :return: Unescaped string
         """
-        new_value = ""
-        escaped = False
-        for char in value:
-            if escaped:
-                new_value += TAG_VALUE_ESCAPES.get(f"\\{char}", char)
-                escaped = False
-            elif char == "\\":
-                escaped = True
-            else:
-                new_value += char
-
-        return new_value
+        if "\\" not in value:
+            return value
+
+        return TAG_VALUE_ESCAPE_RE.sub(_unescape_match, value)
 
     @staticmethod
     def escape(value: str) -> str:
@@ -243,7 +284,18 @@ class MessageTag(Parseable):
         :param value: The raw string
         :return: The escaped string
         """
-        return "".join(TAG_VALUE_UNESCAPES.get(c, c) for c in value)
+        # Most values have nothing to escape, and these substring scans are
+        # much cheaper than translating the value in to an identical copy
+        if (
+            "\\" in value
+            or ";" in value
+            or " " in value
+            or "\r" in value
+            or "\n" in value
+        ):
+            return value.translate(TAG_VALUE_ESCAPE_TABLE)
+
+        return value
 
     @classmethod
     def parse(cls, text: str) -> Self:
@@ -257,29 +309,19 @@ class MessageTag(Parseable):
         """
         name, sep, value = text.partition(TAG_VALUE_SEP)
         if value:
-            value = MessageTag.unescape(value)
+            value = cls.unescape(value)
 
         return cls(name, value, has_value=bool(sep))
 
-    def __eq__(self, other: object) -> bool:
-        """Compare tag to a string representing a tag or another tag object."""
-        if isinstance(other, str):
-            return self == self.parse(other)
-
-        if isinstance(other, MessageTag):
-            return self.name == other.name and self.value == other.value
-
-        return NotImplemented
-
-    def __ne__(self, other: object) -> bool:
-        """Compare tag to a string representing a tag or another tag object."""
-        if isinstance(other, str):
-            return self != self.parse(other)
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, MessageTag):
+            return obj.name, obj.value
 
-        if isinstance(other, MessageTag):
-            return not (self.name == other.name and self.value == other.value)
+        if isinstance(obj, str):
+            # Reuse the shared parse cache rather than building a new tag
+            return self._cmp_key(_parse_tag_item(obj)[1])
 
-        return NotImplemented
+        return super()._cmp_key(obj)
 
     def __repr__(self) -> str:
         """Represent the tag object in a form useful for debugging."""
@@ -287,41 +329,39 @@ class MessageTag(Parseable):
 
     def __str__(self) -> str:
         """Represent the tag object as a string representation of a tag."""
-        if self.value or self._has_value:
-            return f"{self.name}{TAG_VALUE_SEP}{self.escape(self.value)}"
+        if self._value or self._has_value:
+            return f"{self._name}{TAG_VALUE_SEP}{self.escape(self._value)}"
+
+        return self._name
+
 
-        return self.name
+def _unescape_match(match: "re.Match[str]") -> str:
+    # Unknown escapes resolve to the escaped character itself
+    return TAG_VALUE_ESCAPES.get(match.group(0), match.group(1))
+
+
+@lru_cache(maxsize=4096)
+def _parse_tag_item(text: str) -> Tuple[str, MessageTag]:
+    # Tag keys and values repeat heavily across a connection, and MessageTag
+    # is read-only, so every TagList containing the same raw tag can share a
+    # single instance rather than allocating its own. The name is cached
+    # alongside it to skip the property lookup when filling the dict.
+    tag = MessageTag.parse(text)
+    return tag.name, tag
 
 
 class TagList(Parseable, Dict[str, MessageTag]):
     """Object representing the list of message tags on a line."""
 
+    __slots__ = ()
+
     def __init__(self, tags: Iterable[MessageTag] = ()) -> None:
         """Construct a tag list with optional tags.
 
         Args:
             tags: Tags to initialize the list with. Defaults to ().
         """
-        super().__init__((tag.name, tag) for tag in tags)
-
-    @staticmethod
-    def _cmp_type_map(obj: object) -> Dict[str, MessageTag]:
-        if isinstance(obj, str):
-            return TagList.parse(obj)
-
-        if isinstance(obj, dict):
-            sample = next(iter(obj.values()), None)
-            if obj and (sample is None or isinstance(sample, str)):
-                # Handle str -> str dict
-                return TagList.from_dict(obj)
-
-            # Handle str -> MessageTag dict
-            return dict(obj)
-
-        if isinstance(obj, list):
-            return TagList(obj)
-
-        return NotImplemented
+        super().__init__({tag.name: tag for tag in tags})
 
     @classmethod
     def parse(cls, text: str) -> Self:
@@ -330,28 +370,37 @@ class TagList(Parseable, Dict[str, MessageTag]):
         :param text: The string to parse
         :return: The parsed object
         """
-        return cls(map(MessageTag.parse, filter(None, text.split(TAGS_SEP))))
+        # Insert the tags directly rather than through a generator in __init__
+        tags = cls()
+        for token in text.split(TAGS_SEP):
+            if token:
+                name, tag = _parse_tag_item(token)
+                tags[name] = tag
+
+        return tags
 
     @classmethod
     def from_dict(cls, tags: Dict[str, str]) -> Self:
         """Create a TagList from a dict of tags."""
         return cls(MessageTag(k, v) for k, v in tags.items())
 
-    def __eq__(self, other: object) -> bool:
-        """Compare to another tag list, string, or list of MessageTag objects."""
-        obj = self._cmp_type_map(other)
-        if obj is NotImplemented:
-            return NotImplemented
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, TagList):
+            return dict(obj)
+
+        if isinstance(obj, dict):
+            sample = next(iter(obj.values()), None)
+            if obj and (sample is None or isinstance(sample, str)):
+                # Handle str -> str dict
+                return dict(TagList.from_dict(obj))
 
-        return dict(self) == dict(obj)
+            # Handle str -> MessageTag dict
+            return dict(obj)
 
-    def __ne__(self, other: object) -> bool:
-        """Compare to another tag list, string, or list of MessageTag objects."""
-        obj = self._cmp_type_map(other)
-        if obj is NotImplemented:
-            return NotImplemented
+        if isinstance(obj, list):
+            return dict(TagList(obj))
 
-        return dict(self) != dict(obj)
+        return super()._cmp_key(obj)
 
     def __str__(self) -> str:
         """Represent the tag list as a string."""
@@ -361,6 +410,8 @@ class TagList(Parseable, Dict[str, MessageTag]):
 class Prefix(Parseable):
     """Object representing the prefix of a line."""
 
+    __slots__ = ("_host", "_nick", "_user")
+
     def __init__(
         self,
         nick: Optional[str] = None,
@@ -395,14 +446,17 @@ class Prefix(Parseable):
     @property
     def mask(self) -> str:
         """The complete n!u@h mask."""
-        mask = self.nick
-        if self.user:
-            mask += PREFIX_USER_SEP + self.user
+        nick, user, host = self._nick, self._user, self._host
+        if user:
+            if host:
+                return f"{nick}{PREFIX_USER_SEP}{user}{PREFIX_HOST_SEP}{host}"
+
+            return f"{nick}{PREFIX_USER_SEP}{user}"
 
-        if self.host:
-            mask += PREFIX_HOST_SEP + self.host
+        if host:
+            return f"{nick}{PREFIX_HOST_SEP}{host}"
 
-        return mask
+        return nick
 
     @property
     def _data(self) -> Tuple[str, str, str]:
@@ -421,51 +475,53 @@ class Prefix(Parseable):
         if not text:
             return cls()
 
-        match = PREFIX_RE.match(text)
-        if not match:  # pragma: no cover
-            # This should never trip, we are pretty lenient with prefixes
-            msg = "Invalid IRC prefix format"
-            raise ParseError(msg)
+        if text[0] == PREFIX_SENTINEL:
+            text = text[1:]
 
-        nick, user, host = match.groups()
+        # The host is everything after the first '@', and the user is
+        # everything between the first '!' and that '@'. Any newlines are kept
+        # as part of the components rather than rejected.
+        text, _, host = text.partition(PREFIX_HOST_SEP)
+        nick, _, user = text.partition(PREFIX_USER_SEP)
         return cls(nick, user, host)
 
     def __iter__(self) -> Iterator[str]:
         """Iterator over the prefix components."""
         return iter(self._data)
 
-    def __eq__(self, other: object) -> bool:
-        """Compare to prefix string or another prefix object."""
-        if isinstance(other, str):
-            return self == self.parse(other)
-
-        if isinstance(other, Prefix):
-            return self._data == other._data
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, Prefix):
+            return obj.nick, obj.user, obj.host
 
-        return NotImplemented
-
-    def __ne__(self, other: object) -> bool:
-        """Compare to prefix string or another prefix object."""
-        if isinstance(other, str):
-            return self != self.parse(other)
-
-        if isinstance(other, Prefix):
-            return self._data != other._data
+        if isinstance(obj, str):
+            # Reuse the shared parse cache rather than building a new prefix
+            return self._cmp_key(_parse_source(obj))
 
-        return NotImplemented
+        return super()._cmp_key(obj)
 
     def __bool__(self) -> bool:
         """Return whether the prefix contains any values."""
-        return any(self)
+        return bool(self._nick or self._user or self._host)
 
     def __str__(self) -> str:
         """Represent the prefix as a string."""
         return self.mask
 
 
+@lru_cache(maxsize=4096)
+def _parse_source(text: str) -> Prefix:
+    # The same few nick!user@host sources send most of the lines on a
+    # connection. Prefix is read-only, so share one parsed instance (and its
+    # component strings) between every message from the same source, rather
+    # than interning the server-supplied strings for the life of the process.
+    return Prefix.parse(text)
+
+
 class ParamList(Parseable, List[str]):
     """An object representing the parameter list from a line."""
 
+    __slots__ = ("_has_trail",)
+
     def __init__(self, *params: str, has_trail: bool = False) -> None:
         """Construct list of parameters."""
         super().__init__(params)
@@ -483,7 +539,7 @@ class ParamList(Parseable, List[str]):
             return cls()
 
         args = list(data[:-1])
-        if data[-1].startswith(TRAIL_SENTINEL) or not data[-1]:
+        if data[-1][:1] == TRAIL_SENTINEL or not data[-1]:
             has_trail = True
             args.append(data[-1])
         else:
@@ -502,60 +558,50 @@ class ParamList(Parseable, List[str]):
         Returns:
             The parsed object
         """
-        args = []
-        has_trail = False
-        while text:
-            if text[0] == TRAIL_SENTINEL:
-                args.append(text[1:])
-                has_trail = True
-                break
-
-            arg, _, text = text.partition(PARAM_SEP)
-            if arg:
-                args.append(arg)
-
-        return cls(*args, has_trail=has_trail)
-
-    def __eq__(self, other: object) -> bool:
-        """Compare to string or list of parameters."""
-        if isinstance(other, str):
-            return self == self.parse(other)
+        if not text:
+            return cls()
 
-        if isinstance(other, list):
-            return list(self) == list(self.from_list(other))
+        parts = text.split(PARAM_SEP)
+        for i, part in enumerate(parts):
+            if part[:1] == TRAIL_SENTINEL:
+                # Everything after the sentinel is one parameter, spaces and all
+                trail = PARAM_SEP.join(parts[i:])[1:]
+                return cls(*filter(None, parts[:i]), trail, has_trail=True)
 
-        return NotImplemented
+        return cls(*filter(None, parts))
 
-    def __ne__(self, other: object) -> bool:
-        """Compare to string or list of parameters."""
-        if isinstance(other, str):
-            return self != self.parse(other)
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, list):
+            return list(obj)
 
-        if isinstance(other, list):
-            return list(self) != list(other)
-
-        return NotImplemented
+        return super()._cmp_key(obj)
 
     def __str__(self) -> str:
         """Represent this parameter list as a string."""
         if not self:
             return ""
 
+        last = self[-1]
         needs_trail = (
-            PARAM_SEP in self[-1]
-            or self[-1].startswith(TRAIL_SENTINEL)
-            or not self[-1]
+            PARAM_SEP in last or last[:1] == TRAIL_SENTINEL or not last
         )
 
-        if self.has_trail or needs_trail:
-            return PARAM_SEP.join(self[:-1] + [TRAIL_SENTINEL + self[-1]])
+        if not (self._has_trail or needs_trail):
+            return PARAM_SEP.join(self)
+
+        if len(self) == 1:
+            return f"{TRAIL_SENTINEL}{last}"
 
-        return PARAM_SEP.join(self)
+        head = PARAM_SEP.join(self[:-1])
+        return f"{head}{PARAM_SEP}{TRAIL_SENTINEL}{last}"
 
 
 def _parse_tags(
     tags: Union[TagList, Dict[str, str], str, None, List[str]],
 ) -> MsgTagList:
+    if tags is None:
+        return None
+
     if isinstance(tags, TagList):
         return tags
 
@@ -565,21 +611,18 @@ def _parse_tags(
     if isinstance(tags, str):
         return TagList.parse(tags)
 
-    if tags is None:
-        return None
-
     return TagList(MessageTag.parse(str(tag)) for tag in tags)
 
 
 def _parse_prefix(prefix: Union[Prefix, str, None, Iterable[str]]) -> MsgPrefix:
+    if prefix is None:
+        return None
+
     if isinstance(prefix, Prefix):
         return prefix
 
     if isinstance(prefix, str):
-        return Prefix.parse(prefix)
-
-    if prefix is None:
-        return None
+        return _parse_source(prefix)
 
     return Prefix(*prefix)
 
@@ -587,6 +630,9 @@ def _parse_prefix(prefix: Union[Prefix, str, None, Iterable[str]]) -> MsgPrefix:
 def _parse_params(
     parameters: Tuple[Union[str, List[str], ParamList], ...],
 ) -> ParamList:
+    if not parameters:
+        return ParamList()
+
     if len(parameters) == 1 and not isinstance(parameters[0], str):
         # This seems to be a list
         if isinstance(parameters[0], ParamList):
@@ -597,9 +643,73 @@ def _parse_params(
     return ParamList.from_list(cast(Tuple[str, ...], parameters))
 
 
+def _canonical_command(command: str) -> str:
+    """Uppercase a command, reusing a shared string for commands seen before.
+
+    Both the raw and uppercased spellings are cached, so repeat commands in
+    any case skip the `upper()` call entirely.
+    """
+    cached = _command_cache.get(command)
+    if cached is not None:
+        return cached
+
+    upper = command.upper()
+    canonical = _command_cache.get(upper, upper)
+    # Up to two keys are added, so leave room for both
+    if len(_command_cache) + 2 <= COMMAND_CACHE_SIZE:
+        _command_cache[upper] = canonical
+        _command_cache[command] = canonical
+
+    return canonical
+
+
+def _split_message(text: str) -> Tuple[Optional[str], Optional[str], str, str]:
+    """Split a raw line in to its tags, prefix, command and parameters.
+
+    The line is scanned once from left to right, tracking offsets and only
+    slicing out each segment once its bounds are known. The tag and prefix
+    segments are returned without their sentinels, or as None if the line
+    has no such segment.
+    """
+    tags = None
+    prefix = None
+    end = len(text)
+    pos = 0
+    if end and text[0] == TAGS_SENTINEL:
+        sep = text.find(PARAM_SEP)
+        if sep < 0:
+            sep = end
+
+        tags = text[1:sep]
+        pos = sep + 1
+
+    if pos < end and text[pos] == PREFIX_SENTINEL:
+        sep = text.find(PARAM_SEP, pos)
+        if sep < 0:
+            sep = end
+
+        prefix = text[pos + 1 : sep]
+        pos = sep + 1
+
+    sep = text.find(PARAM_SEP, pos)
+    if sep < 0:
+        return tags, prefix, text[pos:], ""
+
+    return tags, prefix, text[pos:sep], text[sep + 1 :]
+
+
 class Message(Parseable):
     """An object representing a parsed IRC line."""
 
+    __slots__ = (
+        "_command",
+        "_parameters",
+        "_prefix",
+        "_raw_prefix",
+        "_raw_tags",
+        "_tags",
+    )
+
     def __init__(
         self,
         tags: Union[TagList, Dict[str, str], str, None, List[str]],
@@ -612,15 +722,25 @@ class Message(Parseable):
         self._prefix = _parse_prefix(prefix)
         self._command = command
         self._parameters = _parse_params(parameters)
+        self._raw_tags: Optional[str] = None
+        self._raw_prefix: Optional[str] = None
 
     @property
     def tags(self) -> MsgTagList:
         """IRC tag list."""
+        if self._raw_tags is not None:
+            self._tags = TagList.parse(self._raw_tags)
+            self._raw_tags = None
+
         return self._tags
 
     @property
     def prefix(self) -> MsgPrefix:
         """IRC prefix."""
+        if self._raw_prefix is not None:
+            self._prefix = _parse_source(self._raw_prefix)
+            self._raw_prefix = None
+
         return self._prefix
 
     @property
@@ -637,6 +757,30 @@ class Message(Parseable):
         """Get the message object as a tuple of values."""
         return self.tags, self.prefix, self.command, self.parameters
 
+    @classmethod
+    def _from_parts(
+        cls,
+        raw_tags: Optional[str],
+        raw_prefix: Optional[str],
+        command: str,
+        parameters: ParamList,
+    ) -> Self:
+        """Construct a message from the parts of a split line.
+
+        This skips the argument coercion done in `__init__`. The tags and
+        prefix are kept as raw strings and only parsed the first time they
+        are accessed, as many handlers only look at the command and
+        parameters. None means the line had no tags or prefix at all.
+        """
+        self = cls.__new__(cls)
+        self._tags = None
+        self._prefix = None
+        self._command = command
+        self._parameters = parameters
+        self._raw_tags = raw_tags
+        self._raw_prefix = raw_prefix
+        return self
+
     @classmethod
     def parse(cls, text: Union[str, bytes]) -> Self:
         """Parse an IRC message in to objects."""
@@ -646,56 +790,95 @@ class Message(Parseable):
         if isinstance(text, (bytes, bytearray)):
             text = text.decode(errors="ignore")
 
-        tags = ""
-        prefix = ""
-        if text.startswith(TAGS_SENTINEL):
-            tags, _, text = text.partition(PARAM_SEP)
+        # The tags and prefix are None if the line has none, which keeps
+        # empty tags '@ CMD' and prefixes ': CMD' distinct from missing ones
+        tags, prefix, command, params = _split_message(text)
+        command = _canonical_command(command)
+        param_obj = ParamList.parse(params)
+        return cls._from_parts(tags, prefix, command, param_obj)
 
-        if text.startswith(PREFIX_SENTINEL):
-            prefix, _, text = text.partition(PARAM_SEP)
+    @classmethod
+    def parse_many(
+        cls, data: Union[str, bytes, bytearray, memoryview]
+    ) -> List[Self]:
+        r"""Parse a buffer of newline separated IRC messages.
+
+        Lines may end in either CRLF or a bare LF, and empty lines are
+        skipped. The buffer is decoded once as a whole rather than per line,
+        so it should only contain complete lines.
+
+        >>> msgs = Message.parse_many(b"PING a\r\nPING b\r\n")
+        >>> [str(msg) for msg in msgs]
+        ['PING a', 'PING b']
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
 
-        command, _, params = text.partition(PARAM_SEP)
-        # Differentiate empty tags '@ CMD' from no tags 'CMD'
-        tags_obj = TagList.parse(tags[1:]) if tags else None
-        # Differentiate empty prefix ': CMD' from no prefix 'CMD'
-        prefix_obj = Prefix.parse(prefix[1:]) if prefix else None
-        command = command.upper()
-        param_obj = ParamList.parse(params)
-        return cls(tags_obj, prefix_obj, command, param_obj)
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode(errors="ignore")
 
-    def __eq__(self, other: object) -> bool:
-        """Compare to another message which can be str, bytes, or a Message object."""
-        if isinstance(other, (str, bytes)):
-            return self == Message.parse(other)
+        return [
+            cls.parse(line[:-1] if line[-1] == "\r" else line)
+            for line in data.split("\n")
+            if line and line != "\r"
+        ]
 
-        if isinstance(other, Message):
-            return self.as_tuple() == other.as_tuple()
+    @classmethod
+    def parse_cached(
+        cls, text: Union[str, bytes, bytearray, memoryview]
+    ) -> Self:
+        """Parse a line, reusing the result for recently seen identical lines.
+
+        Useful for lines that repeat verbatim, like server PINGs. The returned
+        Message is shared between callers, so its parameters and tags must not
+        be modified; use `parse` to get a private copy.
+        """
+        if isinstance(text, (bytearray, memoryview)):
+            # Mutable buffers can't be cache keys, so take an immutable copy
+            text = bytes(text)
 
-        return NotImplemented
+        return cast(Self, _parse_message_cached(cls.parse, text))
 
-    def __ne__(self, other: object) -> bool:
-        """Compare to another message which can be str, bytes, or a Message object."""
-        if isinstance(other, (str, bytes)):
-            return self != Message.parse(other)
+    def _cmp_key(self, obj: object) -> object:
+        if isinstance(obj, Message):
+            return obj.as_tuple()
 
-        if isinstance(other, Message):
-            return self.as_tuple() != other.as_tuple()
+        if isinstance(obj, bytes):
+            return self._cmp_key(self.parse(obj))
 
-        return NotImplemented
+        return super()._cmp_key(obj)
 
     def __bool__(self) -> bool:
         """Check if the line is empty or not."""
-        return any(self.as_tuple())
+        # Check the command first, it is set on nearly every line and avoids
+        # parsing the tags and prefix
+        return bool(
+            self._command or self._parameters or self.tags or self.prefix
+        )
 
     def __str__(self) -> str:
         """Represent this Message as a properly formatted IRC line."""
-        tag_str = "" if self.tags is None else TAGS_SENTINEL + str(self.tags)
-        prefix_str = (
-            "" if self.prefix is None else PREFIX_SENTINEL + str(self.prefix)
-        )
+        parts = []
+        tags = self.tags
+        if tags is not None:
+            parts.append(TAGS_SENTINEL + str(tags))
 
-        return PARAM_SEP.join(
-            str(s)
-            for s in (tag_str, prefix_str, self.command, self.parameters)
-            if s
-        )
+        prefix = self.prefix
+        if prefix is not None:
+            parts.append(PREFIX_SENTINEL + str(prefix))
+
+        if self._command:
+            parts.append(self._command)
+
+        if self._parameters:
+            parts.append(str(self._parameters))
+
+        return PARAM_SEP.join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _parse_message_cached(
+    parse: Callable[[Union[str, bytes]], Message], text: Union[str, bytes]
+) -> Message:
+    # Keyed on the bound parse method, so subclasses get their own instances
+    return parse(text)
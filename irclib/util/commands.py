@@ -1,13 +1,19 @@
 """IRC command data and utilities."""
 
-from typing import Iterator, List, Mapping, Optional, cast
+from typing import Dict, Final, Iterable, Iterator, Mapping, Optional, Tuple
 
 import attr
 
 __all__ = ("Command", "client_commands")
 
+# Maps an argument's enclosing brackets to whether it is required
+ARG_BRACKETS: Final[Dict[Tuple[str, str], bool]] = {
+    ("<", ">"): True,
+    ("[", "]"): False,
+}
 
-@attr.s(frozen=True, hash=True, auto_attribs=True)
+
+@attr.s(frozen=True, hash=True, slots=True, auto_attribs=True)
 class CommandArgument:
     """A single IRC command argument."""
 
@@ -26,62 +32,64 @@ class CommandArgument:
         :param s: String to parse
         :return: Parsed argument
         """
-        start_end = s[0] + s[-1]
-        name = s[1:-1]
-        if start_end == "<>":
-            required = True
-        elif start_end == "[]":
-            required = False
-        else:
+        required = ARG_BRACKETS.get((s[0], s[-1]))
+        if required is None:
             msg = f"Unable to parse argument: {s}"
             raise ValueError(msg)
 
-        return cls(name, required)
+        return cls(s[1:-1], required)
+
+
+def _args_tuple(args: Iterable[CommandArgument]) -> Tuple[CommandArgument, ...]:
+    return tuple(args)
 
 
-@attr.s(frozen=True, hash=True, auto_attribs=True)
+@attr.s(frozen=True, hash=True, slots=True, auto_attribs=True)
 class Command:
     """A single IRC command."""
 
     name: str
-    args: List[CommandArgument]
+    args: Tuple[CommandArgument, ...] = attr.ib(converter=_args_tuple)
     min_args: int = 0
     max_args: Optional[int] = None
 
 
 class LookupDict(Mapping[str, Command]):
-    """Command lookup dictionary."""
+    """Command lookup dictionary.
+
+    Lookups are case-insensitive. Commands are also available as attributes
+    under their lower and upper case names.
+    """
 
     def __init__(self, *commands: Command) -> None:
+        self._commands: Dict[str, Command] = {}
         for command in commands:
+            self._commands[command.name.upper()] = command
             setattr(self, command.name.lower(), command)
             setattr(self, command.name.upper(), command)
 
     def __getitem__(self, key: str) -> Command:
-        try:
-            return cast(Command, getattr(self, key))
-        except AttributeError as e:
-            raise KeyError(key) from e
+        return self._commands[key.upper()]
 
     def __iter__(self) -> Iterator[str]:
-        raise NotImplementedError
+        return iter(self._commands)
 
     def __len__(self) -> int:
-        raise NotImplementedError
+        return len(self._commands)
+
 
+_TARGET_ARG: Final = CommandArgument("target", required=True)
+_CONTENT_ARG: Final = CommandArgument("content", required=True)
 
 # Commands sent from the client to the server
 client_commands = LookupDict(
-    Command(
-        "PRIVMSG",
-        [CommandArgument.parse("<target>"), CommandArgument.parse("<content>")],
-    ),
-    Command(
-        "NOTICE",
-        [CommandArgument.parse("<target>"), CommandArgument.parse("<content>")],
-    ),
+    Command("PRIVMSG", (_TARGET_ARG, _CONTENT_ARG)),
+    Command("NOTICE", (_TARGET_ARG, _CONTENT_ARG)),
     Command(
         "JOIN",
-        [CommandArgument.parse("<channel>"), CommandArgument.parse("[key]")],
+        (
+            CommandArgument("channel", required=True),
+            CommandArgument("key", required=False),
+        ),
     ),
 )
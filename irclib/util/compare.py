@@ -1,18 +1,34 @@
 """IRC string comparison utilities."""
 
 import re
-from typing import Final
+from functools import lru_cache
+from typing import Final, Pattern
 
 __all__ = ("match_mask",)
 
 GLOB_MAP: Final = {"?": ".", "*": ".*"}
 
+# Escapes the same characters as re.escape(), in a single translate() pass
+REGEX_ESCAPE_TABLE: Final = str.maketrans(
+    {c: "\\" + c for c in "()[]{}?*+-|^$\\.&~# \t\n\r\v\f"}
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile_mask(pattern: str) -> Pattern[str]:
+    """Compile a mask pattern, caching the result for repeat checks."""
+    re_pattern = pattern.translate(REGEX_ESCAPE_TABLE)
+    for glob, regex in GLOB_MAP.items():
+        re_pattern = re_pattern.replace("\\" + glob, regex)
+
+    # \Z rather than $, which would also match before a trailing newline
+    return re.compile(f"^{re_pattern}\\Z")
+
 
 def match_mask(mask: str, pattern: str) -> bool:
     """Match hostmask patterns in the standard banmask syntax (eg '*!*@host')."""
-    re_pattern = ""
-    for c in pattern:
-        re_pattern += GLOB_MAP.get(c, re.escape(c))
+    if "*" not in pattern and "?" not in pattern:
+        # No wildcards, so this is a plain string comparison
+        return mask == pattern
 
-    regex = re.compile(f"^{re_pattern}$")
-    return bool(regex.match(mask))
+    return _compile_mask(pattern).match(mask) is not None
@@ -3,8 +3,8 @@
 from typing import (
     Dict,
     Iterable,
-    Iterator,
     Mapping,
+    NoReturn,
     Optional,
     Tuple,
     TypeVar,
@@ -18,13 +18,19 @@ __all__ = ("FrozenDict",)
 _V = TypeVar("_V")
 
 
-class FrozenDict(Mapping[str, _V]):
+def _immutable(self: object, *_args: object, **_kwargs: object) -> NoReturn:
+    msg = f"{type(self).__name__!r} object is immutable"
+    raise TypeError(msg)
+
+
+class FrozenDict(Dict[str, _V]):
     """Frozen Mapping.
 
-    An immutable mapping of string -> Any type
+    An immutable mapping of string -> Any type. Reads are served directly by
+    the underlying dict, and all of the dict mutators raise TypeError.
     """
 
-    __slots__ = ("__hash", "__data")
+    __slots__ = ("__hash",)
 
     def __init__(
         self,
@@ -32,11 +38,21 @@ class FrozenDict(Mapping[str, _V]):
         **kwargs: _V,
     ) -> None:
         """Construct a FrozenDict."""
-        d = dict(seq, **kwargs) if seq is not None else dict(**kwargs)
+        if seq is None:
+            super().__init__(**kwargs)
+        else:
+            super().__init__(seq, **kwargs)
 
-        self.__data: Dict[str, _V] = d
         self.__hash: Optional[int] = None
 
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, _V]]]:
+        """Pickle the dict by its items, as the mutators are disabled."""
+        return self.__class__, (dict(self),)
+
     def copy(self, **kwargs: _V) -> Self:
         """Copy dict, replacing values according to kwargs.
 
@@ -49,23 +65,11 @@ class FrozenDict(Mapping[str, _V]):
         >>> fd["a"]
         1
         """
-        return self.__class__(self.__data, **kwargs)
-
-    def __getitem__(self, k: str) -> _V:
-        """Retrieve an item from the dict by key."""
-        return self.__data[k]
-
-    def __iter__(self) -> Iterator[str]:
-        """Iterate the keys of the dict."""
-        return iter(self.__data)
-
-    def __len__(self) -> int:
-        """Number of keys in the dict."""
-        return len(self.__data)
+        return self.__class__(self, **kwargs)
 
-    def __hash__(self) -> int:
+    def __hash__(self) -> int:  # type: ignore[override]
         """Get hash for the dict."""
         if self.__hash is None:
-            self.__hash = hash(tuple(self.items()))
+            self.__hash = hash(frozenset(self.items()))
 
         return self.__hash
@@ -10,6 +10,8 @@ __all__ = ("Numeric", "numerics")
 class Numeric:
     """IRC numeric information."""
 
+    __slots__ = ("name", "numeric")
+
     name: str
     numeric: int
 
@@ -22,7 +24,6 @@ class NumericsDict(Mapping[str, Numeric]):
         self.data = args
         self.names = {num.name: num for num in args}
         self.nums = {num.numeric: num for num in args}
-        self.num_strs = {str(num.numeric).zfill(3): num for num in args}
 
     def from_int(self, n: int) -> Numeric:
         """Get a numeric by its number."""
@@ -42,7 +43,7 @@ class NumericsDict(Mapping[str, Numeric]):
         return self.nums[int(key)]
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.num_strs)
+        return (f"{n:03d}" for n in self.nums)
 
     def __len__(self) -> int:
         return len(self.names)
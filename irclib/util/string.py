@@ -1,9 +1,8 @@
 """IRC string utils."""
 
-import operator
 import string
+from functools import lru_cache
 from typing import (
-    Callable,
     Dict,
     Final,
     List,
@@ -29,13 +28,34 @@ class Casemap(NamedTuple):
 
     @property
     def lower_table(self) -> Dict[int, int]:
-        """The lower->upper translation table."""
-        return str.maketrans(self.lower, self.upper)
+        """The lower->upper translation table.
+
+        The table is shared by all equal casemaps and must not be modified.
+        """
+        return _make_table(self.lower, self.upper)
 
     @property
     def upper_table(self) -> Dict[int, int]:
-        """The upper->lower table."""
-        return str.maketrans(self.upper, self.lower)
+        """The upper->lower table.
+
+        The table is shared by all equal casemaps and must not be modified.
+        """
+        return _make_table(self.upper, self.lower)
+
+    @property
+    def swap_table(self) -> Dict[int, int]:
+        """The table mapping each case to the other.
+
+        The table is shared by all equal casemaps and must not be modified.
+        """
+        return _make_table(self.lower + self.upper, self.upper + self.lower)
+
+
+@lru_cache(maxsize=32)
+def _make_table(src: str, dst: str) -> Dict[int, int]:
+    # Casemap is a NamedTuple and can't hold the tables itself, so build each
+    # one once here instead of on every lower()/upper() call
+    return str.maketrans(src, dst)
 
 
 RFC1459: Final = Casemap(
@@ -49,6 +69,43 @@ ASCII: Final = Casemap(
 )
 
 
+@lru_cache(maxsize=32)
+def _make_byte_table(src: str, dst: str) -> Optional[bytes]:
+    # bytes.translate() indexes a flat 256 byte table instead of looking up
+    # each character in a dict, but only works if the casemap is ASCII too
+    if not (src.isascii() and dst.isascii()):
+        return None
+
+    return bytes.maketrans(src.encode("ascii"), dst.encode("ascii"))
+
+
+def _lower_str(value: str, casemap: Casemap) -> str:
+    """Lowercase a string according to a casemap, returning a plain str."""
+    if value.isascii():
+        if casemap is ASCII:
+            # For ASCII text, str.lower() only maps A-Z, same as the table
+            return str.lower(value)
+
+        table = _make_byte_table(casemap.lower, casemap.upper)
+        if table is not None:
+            return value.encode("ascii").translate(table).decode("ascii")
+
+    return str.translate(value, casemap.lower_table)
+
+
+def _upper_str(value: str, casemap: Casemap) -> str:
+    """Uppercase a string according to a casemap, returning a plain str."""
+    if value.isascii():
+        if casemap is ASCII:
+            return str.upper(value)
+
+        table = _make_byte_table(casemap.upper, casemap.lower)
+        if table is not None:
+            return value.encode("ascii").translate(table).decode("ascii")
+
+    return str.translate(value, casemap.upper_table)
+
+
 class TranslateTable(Protocol):
     def __getitem__(self, item: int, /) -> Union[str, int, None]:
         raise NotImplementedError
@@ -57,9 +114,12 @@ class TranslateTable(Protocol):
 class String(str):
     """Case-insensitive string."""
 
-    __slots__ = ("_casemap",)
+    __slots__ = ("_casemap", "_folded", "_lower", "_upper")
 
     _casemap: Casemap
+    _folded: Optional[str]
+    _lower: Optional["String"]
+    _upper: Optional["String"]
 
     def __new__(
         cls, value: str = "", casemap: Optional[Casemap] = None
@@ -67,22 +127,39 @@ class String(str):
         """Construct new String and set casemap."""
         o = str.__new__(cls, value)
         o._casemap = casemap or ASCII  # noqa: SLF001
+        o._folded = None  # noqa: SLF001
+        o._lower = None  # noqa: SLF001
+        o._upper = None  # noqa: SLF001
         return o
 
-    def _wrap(self, value: str) -> "String":
-        """Convert value to String with matching casemap."""
-        return self.__class__.__new__(self.__class__, value, self.casemap)
+    def _wrap(self, value: str, folded: Optional[str] = None) -> "String":
+        """Convert value to String with matching casemap.
 
-    def __internal_cmp(
-        self, other: object, cmp: Callable[[str, str], bool]
-    ) -> bool:
+        If the casefolded form of `value` is already known, it can be passed
+        as `folded` to save the new String from computing it again.
+        """
+        cls = self.__class__
+        o = cls.__new__(cls, value, self._casemap)
+        o._folded = folded  # noqa: SLF001
+        return o
+
+    def _fold(self) -> str:
+        """Get the casefolded value as a plain str, for comparisons."""
+        folded = self._folded
+        if folded is None:
+            folded = self._folded = _lower_str(self, self.casemap)
+
+        return folded
+
+    def __fold_other(self, other: object) -> Optional[str]:
+        """Casefold the other side of a comparison, or None if not a str."""
         if isinstance(other, String):
-            return cmp(str(self.casefold()), str(other.casefold()))
+            return other._fold()  # noqa: SLF001
 
         if isinstance(other, str):
-            return cmp(self, self._wrap(other))
+            return _lower_str(other, self.casemap)
 
-        return NotImplemented
+        return None
 
     def translate(self, table: TranslateTable) -> "String":
         """Apply translation table to string."""
@@ -99,29 +176,26 @@ class String(str):
         """
         return self._capitalize
 
-    @property
-    def _casefold(self) -> "String":
-        return self.lower()
-
     def casefold(self) -> "String":
         """Casefold the string according to the casemap."""
-        return self._casefold
-
-    @property
-    def _lower(self) -> "String":
-        return self.translate(self.casemap.lower_table)
+        return self.lower()
 
     def lower(self) -> "String":
         """Lowercase the string according to the casemap."""
-        return self._lower
+        lowered = self._lower
+        if lowered is None:
+            folded = self._fold()
+            lowered = self._lower = self._wrap(folded, folded)
 
-    @property
-    def _upper(self) -> "String":
-        return self.translate(self.casemap.upper_table)
+        return lowered
 
     def upper(self) -> "String":
         """Uppercase the string according to the casemap."""
-        return self._upper
+        uppered = self._upper
+        if uppered is None:
+            uppered = self._upper = self._wrap(_upper_str(self, self.casemap))
+
+        return uppered
 
     def count(
         self,
@@ -130,9 +204,7 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> int:
         """Count substring occurrences."""
-        return str(self.casefold()).count(
-            self._wrap(sub).casefold(), start, end
-        )
+        return self._fold().count(_lower_str(sub, self.casemap), start, end)
 
     def startswith(
         self,
@@ -141,12 +213,14 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> bool:
         """Check if string starts with a prefix."""
-        prefix_list: Tuple[str, ...]
-        prefix_list = (prefix,) if isinstance(prefix, str) else prefix
-
-        mapped_list = tuple(self._wrap(p).casefold() for p in prefix_list)
+        casemap = self.casemap
+        if isinstance(prefix, str):
+            return self._fold().startswith(
+                _lower_str(prefix, casemap), start, end
+            )
 
-        return str(self.casefold()).startswith(mapped_list, start, end)
+        mapped_list = tuple(_lower_str(p, casemap) for p in prefix)
+        return self._fold().startswith(mapped_list, start, end)
 
     def endswith(
         self,
@@ -155,12 +229,14 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> bool:
         """Check if string ends with a suffix."""
-        suffix_list: Tuple[str, ...]
-        suffix_list = (suffix,) if isinstance(suffix, str) else suffix
+        casemap = self.casemap
+        if isinstance(suffix, str):
+            return self._fold().endswith(
+                _lower_str(suffix, casemap), start, end
+            )
 
-        mapped_list = tuple(self._wrap(p).casefold() for p in suffix_list)
-
-        return str(self.casefold()).endswith(mapped_list, start, end)
+        mapped_list = tuple(_lower_str(p, casemap) for p in suffix)
+        return self._fold().endswith(mapped_list, start, end)
 
     def find(
         self,
@@ -169,7 +245,7 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> int:
         """Find the substring in string."""
-        return str(self.casefold()).find(self._wrap(sub).casefold(), start, end)
+        return self._fold().find(_lower_str(sub, self.casemap), start, end)
 
     def rfind(
         self,
@@ -178,9 +254,7 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> int:
         """Perform a reverse find."""
-        return str(self.casefold()).rfind(
-            self._wrap(sub).casefold(), start, end
-        )
+        return self._fold().rfind(_lower_str(sub, self.casemap), start, end)
 
     def index(
         self,
@@ -189,9 +263,7 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> int:
         """Find the index of the substring."""
-        return str(self.casefold()).index(
-            self._wrap(sub).casefold(), start, end
-        )
+        return self._fold().index(_lower_str(sub, self.casemap), start, end)
 
     def rindex(
         self,
@@ -200,9 +272,7 @@ class String(str):
         end: Optional[SupportsIndex] = None,
     ) -> int:
         """Perform a reverse index."""
-        return str(self.casefold()).rindex(
-            self._wrap(sub).casefold(), start, end
-        )
+        return self._fold().rindex(_lower_str(sub, self.casemap), start, end)
 
     def partition(self, sep: str) -> Tuple["String", "String", "String"]:
         """Partition string on a separator."""
@@ -210,7 +280,7 @@ class String(str):
         if pos < 0:
             return self, self._wrap(""), self._wrap("")
 
-        return self[:pos], self[pos : pos + len(sep)], self[pos + len(sep) :]
+        return self.__split_at(pos, pos + len(sep))
 
     def rpartition(self, sep: str) -> Tuple["String", "String", "String"]:
         """Reverse partition a string on a separator."""
@@ -218,13 +288,46 @@ class String(str):
         if pos < 0:
             return self._wrap(""), self._wrap(""), self
 
-        return self[:pos], self[pos : pos + len(sep)], self[pos + len(sep) :]
+        return self.__split_at(pos, pos + len(sep))
+
+    def __split_at(
+        self, start: int, end: int
+    ) -> Tuple["String", "String", "String"]:
+        # Slice with str.__getitem__ directly, wrapping each part only once.
+        # find() has already folded this string, so hand out folded slices too
+        get = super().__getitem__
+        wrap = self._wrap
+        folded = self._fold()
+        return (
+            wrap(get(slice(start)), folded[:start]),
+            wrap(get(slice(start, end)), folded[start:end]),
+            wrap(get(slice(end, None)), folded[end:]),
+        )
+
+    def __split_folded(self, parts: List[str], sep_len: int) -> List[str]:
+        # Map parts of the casefolded string back to the original text. Case
+        # mapping keeps the length, so each part starts where the previous
+        # one ended plus the separator.
+        get = super().__getitem__
+        wrap = self._wrap
+        out: List[str] = []
+        start = 0
+        for part in parts:
+            end = start + len(part)
+            out.append(wrap(get(slice(start, end)), part))
+            start = end + sep_len
+
+        return out
 
     def replace(
         self, old: str, new: str, count: SupportsIndex = -1
     ) -> "String":
-        """Not currently implemented."""
-        raise NotImplementedError
+        """Replace occurrences of a substring case-insensitively."""
+        if not old:
+            return self._wrap(super().replace(old, new, count))
+
+        parts = self._fold().split(_lower_str(old, self.casemap), count)
+        return self._wrap(new.join(self.__split_folded(parts, len(old))))
 
     def strip(self, chars: Optional[str] = None) -> "String":
         """Remove characters from the beginning and end of the string."""
@@ -233,39 +336,33 @@ class String(str):
     def lstrip(self, chars: Optional[str] = None) -> "String":
         """Remove characters from the beginning of the string."""
         if chars is None:
-            chars = string.whitespace
+            if self._casemap is ASCII:
+                # The ASCII casemap leaves whitespace alone, no need to fold
+                return self._wrap(super().lstrip(string.whitespace))
 
-        chars = self._wrap(chars)
-
-        start = 0
-        while start < len(self) and self[start] in chars:
-            start += 1
+            chars = string.whitespace
 
-        return self[start:]
+        # Casefolding keeps the length, so strip the folded copy in C and
+        # slice the original by how much was removed
+        folded = self._fold()
+        stripped = folded.lstrip(_lower_str(chars, self.casemap))
+        return self[len(folded) - len(stripped) :]
 
     def rstrip(self, chars: Optional[str] = None) -> "String":
         """Remove characters from the end of the string."""
         if chars is None:
-            chars = string.whitespace
-
-        chars = self._wrap(chars)
+            if self._casemap is ASCII:
+                return self._wrap(super().rstrip(string.whitespace))
 
-        end = len(self)
-        while end > 0 and self[end - 1] in chars:
-            end -= 1
-
-        return self[:end]
-
-    @property
-    def _swapcase(self) -> "String":
-        trans = self.casemap.lower_table.copy()
-        trans.update(self.casemap.upper_table)
+            chars = string.whitespace
 
-        return self.translate(trans)
+        folded = self._fold()
+        stripped = folded.rstrip(_lower_str(chars, self.casemap))
+        return self[: len(stripped)]
 
     def swapcase(self) -> "String":
         """Swap lower-case and upper-case characters."""
-        return self._swapcase
+        return self.translate(self.casemap.swap_table)
 
     def title(self) -> str:
         """Not currently implemented."""
@@ -274,14 +371,22 @@ class String(str):
     def split(
         self, sep: Optional[str] = None, maxsplit: SupportsIndex = -1
     ) -> List[str]:
-        """Not currently implemented."""
-        raise NotImplementedError
+        """Split the string on a separator case-insensitively."""
+        if sep is None:
+            return list(map(self._wrap, super().split(None, maxsplit)))
+
+        parts = self._fold().split(_lower_str(sep, self.casemap), maxsplit)
+        return self.__split_folded(parts, len(sep))
 
     def rsplit(
         self, sep: Optional[str] = None, maxsplit: SupportsIndex = -1
     ) -> List[str]:
-        """Not currently implemented."""
-        raise NotImplementedError
+        """Split the string on a separator case-insensitively, from the end."""
+        if sep is None:
+            return list(map(self._wrap, super().rsplit(None, maxsplit)))
+
+        parts = self._fold().rsplit(_lower_str(sep, self.casemap), maxsplit)
+        return self.__split_folded(parts, len(sep))
 
     @property
     def casemap(self) -> Casemap:
@@ -290,14 +395,17 @@ class String(str):
 
     def __getitem__(self, item: Union[SupportsIndex, slice]) -> "String":
         """Get substring."""
-        return self._wrap(super().__getitem__(item))
+        folded = self._folded
+        return self._wrap(
+            super().__getitem__(item), None if folded is None else folded[item]
+        )
 
     def __contains__(self, item: object) -> bool:
         """Check if `item` is in string case-insensitively."""
         if not isinstance(item, str):
             return False
 
-        return self._wrap(item).casefold() in str(self.casefold())
+        return _lower_str(item, self.casemap) in self._fold()
 
     def __add__(self, other: str) -> "String":
         """Concat a string to this one."""
@@ -305,28 +413,65 @@ class String(str):
 
     def __lt__(self, other: str) -> bool:
         """Compare another string to this one case-insensitively."""
-        return self.__internal_cmp(other, operator.lt)
+        folded = self.__fold_other(other)
+        if folded is None:
+            return NotImplemented
+
+        return self._fold() < folded
 
     def __le__(self, other: str) -> bool:
         """Compare another string to this one case-insensitively."""
-        return self.__internal_cmp(other, operator.le)
+        folded = self.__fold_other(other)
+        if folded is None:
+            return NotImplemented
+
+        return self._fold() <= folded
 
     def __eq__(self, other: object) -> bool:
         """Compare another string to this one case-insensitively."""
-        return self.__internal_cmp(other, operator.eq)
+        if other is self:
+            return True
+
+        # Case mapping never changes the length of a string
+        if isinstance(other, str) and len(other) != len(self):
+            return False
+
+        folded = self.__fold_other(other)
+        if folded is None:
+            return NotImplemented
+
+        return self._fold() == folded
 
     def __ne__(self, other: object) -> bool:
         """Compare another string to this one case-insensitively."""
-        return self.__internal_cmp(other, operator.ne)
+        if other is self:
+            return False
+
+        if isinstance(other, str) and len(other) != len(self):
+            return True
+
+        folded = self.__fold_other(other)
+        if folded is None:
+            return NotImplemented
+
+        return self._fold() != folded
 
     def __gt__(self, other: str) -> bool:
         """Compare another string to this one case-insensitively."""
-        return self.__internal_cmp(other, operator.gt)
+        folded = self.__fold_other(other)
+        if folded is None:
+            return NotImplemented
+
+        return self._fold() > folded
 
     def __ge__(self, other: str) -> bool:
         """Compare another string to this one case-insensitively."""
-        return self.__internal_cmp(other, operator.ge)
+        folded = self.__fold_other(other)
+        if folded is None:
+            return NotImplemented
+
+        return self._fold() >= folded
 
     def __hash__(self) -> int:
         """Hash the lowercase string."""
-        return hash(str(self.lower()))
+        return hash(self._fold())
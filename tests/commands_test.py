@@ -3,7 +3,7 @@
 import pytest
 
 from irclib.util import commands
-from irclib.util.commands import CommandArgument
+from irclib.util.commands import Command, CommandArgument
 
 
 def test_command_lookup() -> None:
@@ -17,6 +17,22 @@ def test_command_lookup() -> None:
         _ = commands.client_commands["foo"]
 
 
+def test_command_iter() -> None:
+    """Test iterating over the known commands."""
+    assert len(commands.client_commands) == 3
+    assert list(commands.client_commands) == ["PRIVMSG", "NOTICE", "JOIN"]
+    assert "Join" in commands.client_commands
+
+
+def test_command_hash() -> None:
+    """Test that commands built from a list of args are hashable."""
+    args = [CommandArgument("target"), CommandArgument("message")]
+    cmd = Command("PRIVMSG", args)
+    assert cmd.args == tuple(args)
+    assert isinstance(cmd.args, tuple)
+    assert hash(cmd) == hash(Command("PRIVMSG", tuple(args)))
+
+
 @pytest.mark.parametrize(
     ("text", "name", "required"),
     [("<foo>", "foo", True), ("[foo]", "foo", False)],
@@ -1,5 +1,9 @@
 """Test frozendict util."""
 
+import copy
+
+import pytest
+
 from irclib.util.frozendict import FrozenDict
 
 
@@ -51,3 +55,27 @@ def test_hash() -> None:
     h = hash(fd)
     h1 = hash(fd)
     assert h == h1
+
+
+def test_immutable() -> None:
+    """Test that the dict can't be modified."""
+    fd = FrozenDict(a=1)
+    with pytest.raises(TypeError, match="'FrozenDict' object is immutable"):
+        fd["a"] = 2
+
+    with pytest.raises(TypeError):
+        del fd["a"]
+
+    with pytest.raises(TypeError):
+        fd.update(b=2)
+
+    assert fd == {"a": 1}
+    assert copy.deepcopy(fd) == fd
+
+
+def test_hash_order() -> None:
+    """Test that equal dicts hash the same regardless of key order."""
+    fd = FrozenDict(a=1, b=2)
+    fd1 = FrozenDict(b=2, a=1)
+    assert fd == fd1
+    assert hash(fd) == hash(fd1)
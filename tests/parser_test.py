@@ -1,10 +1,11 @@
 """Test IRC parser."""
 
-from typing import Dict, List, Optional, Tuple, Type, TypedDict
+from typing import Dict, List, Optional, Tuple, Type, TypedDict, Union
 
 import parser_tests.data
 import pytest
 
+from irclib import parser
 from irclib.parser import (
     Cap,
     CapList,
@@ -509,6 +510,21 @@ class TestPrefix:
         assert p.ident == user
         assert p.host == host
 
+    @pytest.mark.parametrize(
+        ("text", "nick", "user", "host"),
+        [
+            (":nick!user@host\n", "nick", "user", "host\n"),
+            (":ni\nck!user@host", "ni\nck", "user", "host"),
+            (":nick!us\ner@host", "nick", "us\ner", "host"),
+            (":nick\n", "nick\n", "", ""),
+        ],
+    )
+    def test_parse_newline(
+        self, text: str, nick: str, user: str, host: str
+    ) -> None:
+        """Test that newlines are kept in the parsed components."""
+        assert tuple(Prefix.parse(text)) == (nick, user, host)
+
     @pytest.mark.parametrize(
         ("nick", "user", "host"),
         [
@@ -729,6 +745,87 @@ class TestMessage:
         assert line.command == "COMMAND"
         assert line.parameters == ["some", "params", "and stuff"]
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "PING a\r\n:nick!user@host PRIVMSG #chan :hi there\r\n",
+            "PING a\n:nick!user@host PRIVMSG #chan :hi there\n",
+            "PING a\r\n\r\n:nick!user@host PRIVMSG #chan :hi there",
+            b"PING a\r\n:nick!user@host PRIVMSG #chan :hi there\r\n",
+            bytearray(b"PING a\n:nick!user@host PRIVMSG #chan :hi there\n"),
+            memoryview(b"PING a\r\n:nick!user@host PRIVMSG #chan :hi there"),
+        ],
+    )
+    def test_parse_many(
+        self, data: Union[str, bytes, bytearray, memoryview]
+    ) -> None:
+        """Test parsing a buffer of multiple lines."""
+        assert Message.parse_many(data) == [
+            "PING a",
+            ":nick!user@host PRIVMSG #chan :hi there",
+        ]
+
+    def test_parse_lazy_parts(self) -> None:
+        """Test that the tags and prefix are parsed once, on first access."""
+        msg = Message.parse("@a=b;c :nick!user@host COMMAND")
+        assert msg.tags is msg.tags
+        assert msg.tags == {"a": "b", "c": None}
+        assert msg.prefix is msg.prefix
+        assert msg.prefix == "nick!user@host"
+
+    def test_parse_cached(self) -> None:
+        """Test that repeated lines share one parsed Message."""
+        msg = Message.parse_cached("PING :irc.example.com")
+        assert msg == "PING :irc.example.com"
+        assert Message.parse_cached("PING :irc.example.com") is msg
+        assert Message.parse_cached(b"PING :irc.example.com") == msg
+        assert Message.parse("PING :irc.example.com") is not msg
+
+    def test_parse_command_shared(self) -> None:
+        """Test that all spellings of a command share one canonical string."""
+        assert Message.parse("privmsg a").command == "PRIVMSG"
+        assert (
+            Message.parse("privmsg a").command
+            is Message.parse("PRIVMSG a").command
+        )
+        assert (
+            Message.parse("fooBar a").command
+            is Message.parse("FOOBAR a").command
+        )
+
+    def test_parse_command_cache_bound(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the command cache never grows past its limit."""
+        monkeypatch.setattr(
+            parser, "_command_cache", dict(parser.KNOWN_COMMANDS)
+        )
+        for i in range(parser.COMMAND_CACHE_SIZE * 2):
+            assert Message.parse(f"cmd{i} a").command == f"CMD{i}"
+
+        cache = parser._command_cache  # noqa: SLF001
+        assert len(cache) <= parser.COMMAND_CACHE_SIZE
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            bytearray(b"PING :irc.example.com"),
+            memoryview(b"PING :irc.example.com"),
+        ],
+    )
+    def test_parse_cached_buffer(
+        self, data: Union[bytearray, memoryview]
+    ) -> None:
+        """Test that unhashable buffers can be passed to parse_cached."""
+        msg = Message.parse_cached(data)
+        assert msg == "PING :irc.example.com"
+        assert Message.parse_cached(data) is msg
+
+    @pytest.mark.parametrize("data", ["", "\r\n", b"\r\n\n"])
+    def test_parse_many_empty(self, data: Union[str, bytes]) -> None:
+        """Test parsing a buffer with no lines."""
+        assert Message.parse_many(data) == []
+
     @pytest.mark.parametrize(
         ("obj", "text"),
         [
@@ -64,6 +64,14 @@ def test_getitem() -> None:
     assert s[0].casemap is s.casemap
 
 
+def test_case_cached() -> None:
+    """Test that case-mapped copies are only built once."""
+    s = String("aBc")
+    assert s.lower() is s.lower()
+    assert s.upper() is s.upper()
+    assert s.casefold() is s.lower()
+
+
 def test_capitalize() -> None:
     """Test `capitalize`."""
     s = String("abC")
@@ -182,3 +190,32 @@ def test_strip() -> None:
     assert s.strip("a") == "bCbAcB"
     s1 = String(" ABc  ")
     assert s1.strip() == "ABc"
+
+
+def test_split() -> None:
+    """Test splitting on a separator."""
+    s = String("aXbxC x d")
+    assert s.split("x") == ["a", "b", "C ", " d"]
+    assert s.split("X", 1) == ["a", "bxC x d"]
+    assert s.split() == ["aXbxC", "x", "d"]
+    assert all(isinstance(part, String) for part in s.split("x"))
+    with pytest.raises(ValueError, match="empty separator"):
+        s.split("")
+
+
+def test_rsplit() -> None:
+    """Test splitting on a separator from the end."""
+    s = String("aXbxC x d")
+    assert s.rsplit("x") == ["a", "b", "C ", " d"]
+    assert s.rsplit("X", 1) == ["aXbxC ", " d"]
+    assert s.rsplit(None, 1) == ["aXbxC x", "d"]
+
+
+def test_replace() -> None:
+    """Test replacing a substring."""
+    s = String("aXbxC", RFC1459)
+    assert s.replace("x", "-") == "a-b-C"
+    assert str(s.replace("X", "-", 1)) == "a-bxC"
+    assert str(s.replace("d", "-")) == "aXbxC"
+    assert str(String("a[b{", RFC1459).replace("{", "|")) == "a|b|"
+    assert isinstance(s.replace("x", "-"), String)
@@ -26,3 +26,10 @@ def test_mask_match(data: MaskCase) -> None:
 
     for hostmask in data["fails"]:
         assert not match_mask(hostmask, pattern)
+
+
+@pytest.mark.parametrize("pattern", ["nick", "nic?", "n*k"])
+def test_mask_trailing_newline(pattern: str) -> None:
+    """Test that a trailing newline is never ignored by the match."""
+    assert match_mask("nick", pattern)
+    assert not match_mask("nick\n", pattern)